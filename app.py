@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import importlib
 import inspect
-from typing import Any
+from typing import Any, Sequence
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -12,13 +12,37 @@ from dotenv import load_dotenv
 from cdss.medqna.composer import compose_answer
 from cdss.medqna.query_router import route_query
 from cdss.medqna.retriever import retrieve_evidence
-from reasoning_engine import Rule, run_engine
+from cdss.medqna.schemas import StructuredAnswer
+from reasoning_engine import CompiledRules, Rule, run_engine
 
-load_dotenv()
 
+@st.cache_resource(show_spinner=False)
+def _load_env_once() -> None:
+    """Parse ``.env`` once per process rather than on every Streamlit rerun."""
 
+    load_dotenv()
+
+
+_load_env_once()
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_import(module_name: str):
+    """Import ``module_name`` once per process; return None when it is unavailable.
+
+    Streamlit re-executes this script on every rerun, so the cache lives in
+    ``st.cache_resource`` rather than in a module-level ``lru_cache``.
+    """
+
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
 def _import_build_facts():
-    """Return build_facts callable if the project provides one."""
+    """Return ``(build_facts, parameter count)`` if the project provides one."""
 
     candidates = (
         "build_facts",
@@ -27,29 +51,31 @@ def _import_build_facts():
         "reasoning_engine",
     )
     for module_name in candidates:
-        try:
-            module = importlib.import_module(module_name)
-        except ImportError:
-            continue
+        module = _cached_import(module_name)
         build_facts = getattr(module, "build_facts", None)
-        if callable(build_facts):
-            return build_facts
-    return None
+        if not callable(build_facts):
+            continue
+        try:
+            return build_facts, len(inspect.signature(build_facts).parameters)
+        except (TypeError, ValueError):
+            return None, 0
+    return None, 0
+
+
+# Optional integrations, resolved once at startup. Missing modules are cached
+# as None by _cached_import, so reruns never re-enter the import machinery.
+_REGISTRY_MOD = _cached_import("registry")
+_BUILD_FACTS_FN, _BUILD_FACTS_ARITY = _import_build_facts()
 
 
 def _load_rules_from_registry(
     selected_packs: list[str],
     guideline_name: str | None,
     guideline_version: str | None,
-) -> list[Rule]:
+) -> Sequence[Rule]:
     """Load rules using registry.load_packs when available."""
 
-    try:
-        registry = importlib.import_module("registry")
-    except ImportError:
-        return []
-
-    load_packs = getattr(registry, "load_packs", None)
+    load_packs = getattr(_REGISTRY_MOD, "load_packs", None)
     if not callable(load_packs):
         return []
 
@@ -72,7 +98,8 @@ def _load_rules_from_registry(
     if packs is None:
         return []
 
-    if isinstance(packs, list) and all(isinstance(rule, Rule) for rule in packs):
+    # Packs are authored homogeneously; CompiledRules validates every rule anyway.
+    if isinstance(packs, list) and packs and isinstance(packs[0], Rule):
         return packs
 
     rules: list[Rule] = []
@@ -83,73 +110,140 @@ def _load_rules_from_registry(
     return rules
 
 
-def _fallback_rules() -> list[Rule]:
-    return [
-        Rule(
-            id="htn_stage2",
-            description="Detect blood pressure pattern suggestive of stage 2 hypertension",
-            condition=lambda f: f.get("systolic_bp", 0) >= 140 or f.get("diastolic_bp", 0) >= 90,
-            outcome={
-                "category": "hypertension",
-                "suggestion": "Consider confirming elevated blood pressure with repeat measurements and guideline-based assessment.",
-                "severity": "moderate",
-            },
-        ),
-        Rule(
-            id="htn_pregnancy_flag",
-            description="Flag elevated blood pressure in pregnancy",
-            condition=lambda f: bool(f.get("pregnancy"))
-            and (f.get("systolic_bp", 0) >= 140 or f.get("diastolic_bp", 0) >= 90),
-            outcome={
-                "category": "maternal-safety",
-                "suggestion": "Use pregnancy-specific hypertension pathways and local obstetric protocols.",
-                "severity": "high",
-            },
-        ),
-    ]
+# Blood pressure thresholds (mmHg) shared by the fallback rules and warnings.
+_STAGE2_SBP, _STAGE2_DBP = 140, 90
+_URGENT_SBP, _URGENT_DBP = 180, 120
+
+_ADVANCED_CKD: frozenset[str] = frozenset(("4", "5"))
+
+
+def _htn_stage2_cond(f: dict[str, Any]) -> bool:
+    return f.get("systolic_bp", 0) >= _STAGE2_SBP or f.get("diastolic_bp", 0) >= _STAGE2_DBP
+
+
+def _htn_preg_cond(f: dict[str, Any]) -> bool:
+    return bool(f.get("pregnancy")) and _htn_stage2_cond(f)
+
+
+_FALLBACK_RULES: Sequence[Rule] = (
+    Rule(
+        id="htn_stage2",
+        description="Detect blood pressure pattern suggestive of stage 2 hypertension",
+        condition=_htn_stage2_cond,
+        reads=("systolic_bp", "diastolic_bp"),
+        outcome={
+            "category": "hypertension",
+            "suggestion": "Consider confirming elevated blood pressure with repeat measurements and guideline-based assessment.",
+            "severity": "moderate",
+        },
+    ),
+    Rule(
+        id="htn_pregnancy_flag",
+        description="Flag elevated blood pressure in pregnancy",
+        condition=_htn_preg_cond,
+        reads=("pregnancy", "systolic_bp", "diastolic_bp"),
+        outcome={
+            "category": "maternal-safety",
+            "suggestion": "Use pregnancy-specific hypertension pathways and local obstetric protocols.",
+            "severity": "high",
+        },
+    ),
+)
+
+
+def _fallback_rules() -> Sequence[Rule]:
+    return _FALLBACK_RULES
+
+
+class _NoRegistryRules(LookupError):
+    """Raised inside the cached registry loader so empty loads are not cached."""
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def _compiled_registry_rules(
+    selected_packs: tuple[str, ...],
+    guideline_name: str | None,
+    guideline_version: str | None,
+) -> CompiledRules:
+    """Compile registry rules for one pack selection, refreshed every 10 minutes.
+
+    Keeping one instance per selection lets CompiledRules memoize conditions
+    across submits. A failed or empty load raises, so it is retried next time.
+    """
+
+    rules = _load_rules_from_registry(list(selected_packs), guideline_name, guideline_version)
+    if not rules:
+        raise _NoRegistryRules
+    return CompiledRules(rules)
+
+
+@st.cache_resource(show_spinner=False)
+def _compiled_fallback_rules() -> CompiledRules:
+    return CompiledRules(_fallback_rules())
+
+
+def _compiled_rules(
+    selected_packs: tuple[str, ...],
+    guideline_name: str | None,
+    guideline_version: str | None,
+) -> tuple[CompiledRules, bool]:
+    """Return the compiled rules and whether the built-in fallback pack was used."""
+
+    try:
+        return _compiled_registry_rules(selected_packs, guideline_name, guideline_version), False
+    except _NoRegistryRules:
+        return _compiled_fallback_rules(), True
+
+
+_CREATININE_UMOL_TO_MG_DL = 88.4  # divisor: creatinine µmol/L -> mg/dL
+_GLUCOSE_MMOL_TO_MG_DL = 18.0
 
 
 def _normalize_labs(facts: dict[str, Any], normalize: bool) -> dict[str, Any]:
     if not normalize:
         return facts
 
-    normalized = dict(facts)
     creatinine = facts.get("creatinine")
-    if creatinine is not None and facts.get("creatinine_unit") == "µmol/L":
-        normalized["creatinine_mg_dl"] = round(creatinine / 88.4, 3)
-    elif creatinine is not None:
-        normalized["creatinine_mg_dl"] = creatinine
-
     glucose = facts.get("glucose")
-    if glucose is not None and facts.get("glucose_unit") == "mmol/L":
-        normalized["glucose_mg_dl"] = round(glucose * 18.0, 2)
-    elif glucose is not None:
-        normalized["glucose_mg_dl"] = glucose
+    if creatinine is None and glucose is None:
+        return facts
+
+    normalized = dict(facts)
+    if creatinine is not None:
+        if facts.get("creatinine_unit") == "µmol/L":
+            normalized["creatinine_mg_dl"] = round(creatinine / _CREATININE_UMOL_TO_MG_DL, 3)
+        else:
+            normalized["creatinine_mg_dl"] = creatinine
+
+    if glucose is not None:
+        if facts.get("glucose_unit") == "mmol/L":
+            normalized["glucose_mg_dl"] = round(glucose * _GLUCOSE_MMOL_TO_MG_DL, 2)
+        else:
+            normalized["glucose_mg_dl"] = glucose
 
     return normalized
 
 
 def _build_facts(raw_facts: dict[str, Any]) -> dict[str, Any]:
-    build_facts = _import_build_facts()
+    build_facts = _BUILD_FACTS_FN
     if not build_facts:
         return raw_facts
 
     try:
-        signature = inspect.signature(build_facts)
-        if len(signature.parameters) == 1:
-            return build_facts(raw_facts)
-        return build_facts(**raw_facts)
+        return build_facts(raw_facts) if _BUILD_FACTS_ARITY == 1 else build_facts(**raw_facts)
     except Exception:
         return raw_facts
 
 
 def _warning_messages(facts: dict[str, Any]) -> list[str]:
     warnings: list[str] = []
-    if facts.get("systolic_bp", 0) >= 180 or facts.get("diastolic_bp", 0) >= 120:
+    sbp = facts.get("systolic_bp", 0)
+    dbp = facts.get("diastolic_bp", 0)
+    if sbp >= _URGENT_SBP or dbp >= _URGENT_DBP:
         warnings.append(
             "Marked blood pressure elevation detected. This output is an informational clinical signal; perform urgent clinician assessment per protocol."
         )
-    if facts.get("ckd_stage") in {"4", "5"}:
+    if facts.get("ckd_stage") in _ADVANCED_CKD:
         warnings.append(
             "Advanced CKD context detected; consider renal dosing, nephrology guidance, and local pathway constraints when interpreting suggestions."
         )
@@ -219,12 +313,10 @@ def _render_reasoning_engine_tab() -> None:
         raw_facts["glucose_unit"] = glucose_unit
 
     facts = _normalize_labs(_build_facts(raw_facts), normalize)
-    rules = _load_rules_from_registry(packs or ["hypertension"], selected_guideline, version)
-    if not rules:
-        st.info("Using built-in fallback pack because no registry packs were loaded.")
-        rules = _fallback_rules()
-
     try:
+        rules, used_fallback = _compiled_rules(tuple(packs or ["hypertension"]), selected_guideline, version)
+        if used_fallback:
+            st.info("Using built-in fallback pack because no registry packs were loaded.")
         result = run_engine(facts, rules, required_fields=["age", "sex", "systolic_bp", "diastolic_bp"])
     except Exception as exc:
         st.error(f"Engine execution failed: {exc}")
@@ -244,6 +336,46 @@ def _render_reasoning_engine_tab() -> None:
         st.info(warning)
 
 
+class _UncachedAnswer(Exception):
+    """Carries an answer built from inaccessible sources past st.cache_data."""
+
+    def __init__(self, answer: StructuredAnswer) -> None:
+        super().__init__("answer built from inaccessible sources")
+        self.answer = answer
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_pipeline(
+    question: str,
+    specialty: str,
+    mcq_mode: bool,
+    choices: tuple[str, ...],
+    user_links: tuple[str, ...],
+) -> StructuredAnswer:
+    """Route, retrieve, and compose once per distinct question for an hour."""
+
+    query_type = route_query(question, mcq_mode=mcq_mode, choices=list(choices))
+    evidence = retrieve_evidence(question=question, specialty=specialty, user_guideline_links=list(user_links))
+    answer = compose_answer(question, query_type, evidence, specialty=specialty, mcq_choices=list(choices))
+    if not all(item.source_accessible for item in evidence):
+        # Raising keeps outage placeholders out of the cache.
+        raise _UncachedAnswer(answer)
+    return answer
+
+
+def _answer_question(
+    question: str,
+    specialty: str,
+    mcq_mode: bool,
+    choices: tuple[str, ...],
+    user_links: tuple[str, ...],
+) -> StructuredAnswer:
+    try:
+        return _cached_pipeline(question, specialty, mcq_mode, choices, user_links)
+    except _UncachedAnswer as degraded:
+        return degraded.answer
+
+
 def _render_medical_qna_tab() -> None:
     st.caption("Medical reference only. Not patient-specific medical advice.")
 
@@ -262,13 +394,11 @@ def _render_medical_qna_tab() -> None:
     if not ask_clicked or not question.strip():
         return
 
-    choices = [line.strip() for line in choices_raw.splitlines() if line.strip()]
-    user_links = [line.strip() for line in user_links_raw.splitlines() if line.strip()]
-    query_type = route_query(question, mcq_mode=mcq_mode, choices=choices)
+    choices = tuple(line.strip() for line in choices_raw.splitlines() if line.strip())
+    user_links = tuple(line.strip() for line in user_links_raw.splitlines() if line.strip())
 
     with st.spinner("Retrieving PubMed and guideline evidence..."):
-        evidence = retrieve_evidence(question=question, specialty=specialty, user_guideline_links=user_links)
-        answer = compose_answer(question, query_type, evidence, specialty=specialty, mcq_choices=choices)
+        answer = _answer_question(question, specialty, mcq_mode, choices, user_links)
 
     st.markdown("### Pathophysiology")
     st.write(answer.pathophysiology)
@@ -291,12 +421,12 @@ def _render_medical_qna_tab() -> None:
 
     st.markdown("### Citations")
     for citation in answer.citations:
-        label = f"{citation.source} — {citation.title}"
+        parts = [f"- {citation.source} — {citation.title}"]
         if citation.year:
-            label += f" ({citation.year})"
+            parts.append(f" ({citation.year})")
         if citation.note:
-            label += f" [{citation.note}]"
-        st.write(f"- {label}")
+            parts.append(f" [{citation.note}]")
+        st.write("".join(parts))
         if citation.url:
             st.write(citation.url)
 
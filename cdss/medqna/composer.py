@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from itertools import islice
+
 from .schemas import Citation, MCQOptionExplanation, QueryType, StructuredAnswer
 from .verifier import verify_answer
 
+_CORRECT_EXPLAIN = "Most consistent with current evidence context."
+_INCORRECT_EXPLAIN = "Less supported by the retrieved evidence summary."
+
 
 def _top_evidence_snippets(evidence, max_items: int = 3) -> str:
-    snippets = []
-    for item in evidence[:max_items]:
-        prefix = "Estimated/Hypothesis-Based" if not item.source_accessible else item.source_name
-        snippets.append(f"- {prefix}: {item.title}")
+    snippets: list[str] = []
+    append = snippets.append
+    for item in islice(evidence, max_items):
+        append(f"- {item.source_name if item.source_accessible else 'Estimated/Hypothesis-Based'}: {item.title}")
     return "\n".join(snippets) if snippets else "No supporting evidence retrieved."
 
 
@@ -25,31 +30,20 @@ def compose_answer(
 
     verification = verify_answer(evidence)
 
-    citations = [
-        Citation(
-            source=item.source_name,
-            title=item.title,
-            year=item.year,
-            url=item.url,
-            note="Estimated/Hypothesis-Based" if not item.source_accessible else None,
-        )
-        for item in evidence[:8]
-    ]
+    citations = [Citation.from_evidence(item) for item in islice(evidence, 8)]
 
-    mcq_explanations: list[MCQOptionExplanation] = []
-    if query_type == QueryType.MCQ and mcq_choices:
-        for idx, option in enumerate(mcq_choices):
-            mcq_explanations.append(
-                MCQOptionExplanation(
-                    option=option,
-                    is_correct=idx == 0,
-                    explanation=(
-                        "Most consistent with current evidence context."
-                        if idx == 0
-                        else "Less supported by the retrieved evidence summary."
-                    ),
-                )
+    mcq_explanations: list[MCQOptionExplanation] = (
+        [
+            MCQOptionExplanation(
+                option=option,
+                is_correct=idx == 0,
+                explanation=_CORRECT_EXPLAIN if idx == 0 else _INCORRECT_EXPLAIN,
             )
+            for idx, option in enumerate(mcq_choices)
+        ]
+        if query_type == QueryType.MCQ and mcq_choices
+        else []
+    )
 
     return StructuredAnswer(
         question=question,
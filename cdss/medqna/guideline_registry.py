@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .schemas import EvidenceSource
 
@@ -27,22 +30,52 @@ CURATED_GUIDELINES: tuple[GuidelineSource, ...] = (
 )
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Only a short preview is needed for availability checks.
+_PREVIEW_BYTES = 1000
+
+# Shared so repeated guideline fetches reuse pooled keep-alive connections.
+_SESSION = _build_session()
+
+
+def _build_specialty_index() -> dict[str, tuple[EvidenceSource, ...]]:
+    """Prebuild guideline evidence per specialty, preserving curated order."""
+
+    built = [
+        (
+            g.specialty,
+            EvidenceSource(
+                source_type="guideline",
+                source_name=g.authority,
+                title=g.title,
+                summary=f"Official guideline source for {g.specialty}.",
+                url=g.url,
+                source_accessible=True,
+            ),
+        )
+        for g in CURATED_GUIDELINES
+    ]
+    index = {
+        specialty: tuple(source for s, source in built if s in ("general", specialty))
+        for specialty, _ in built
+    }
+    index["all"] = tuple(source for _, source in built)
+    return index
+
+
+_BY_SPECIALTY: dict[str, tuple[EvidenceSource, ...]] = _build_specialty_index()
+
+
 def get_guidelines(specialty: str | None = None, user_links: list[str] | None = None) -> list[EvidenceSource]:
     specialty = (specialty or "general").lower()
-    evidence: list[EvidenceSource] = []
-
-    for g in CURATED_GUIDELINES:
-        if g.specialty == "general" or specialty == "all" or specialty == g.specialty:
-            evidence.append(
-                EvidenceSource(
-                    source_type="guideline",
-                    source_name=g.authority,
-                    title=g.title,
-                    summary=f"Official guideline source for {g.specialty}.",
-                    url=g.url,
-                    source_accessible=True,
-                )
-            )
+    evidence = list(_BY_SPECIALTY.get(specialty, _BY_SPECIALTY["general"]))
 
     for link in user_links or []:
         evidence.append(
@@ -63,9 +96,25 @@ def try_fetch_guideline(url: str, timeout: int = 10) -> str | None:
     """Optionally fetch a guideline page for basic availability checks."""
 
     try:
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
+        with _SESSION.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            preview = bytearray()
+            for chunk in response.iter_content(chunk_size=2048):
+                preview += chunk
+                if len(preview) >= _PREVIEW_BYTES:
+                    break
     except Exception:
         return None
 
-    return response.text[:1000]
+    return preview[:_PREVIEW_BYTES].decode("utf-8", "ignore")
+
+
+def fetch_guidelines_bulk(urls: list[str], timeout: int = 10, max_workers: int = 8) -> list[str | None]:
+    """Fetch several guideline pages concurrently; results follow ``urls`` order."""
+
+    if not urls:
+        return []
+
+    fetch = partial(try_fetch_guideline, timeout=timeout)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(fetch, urls))
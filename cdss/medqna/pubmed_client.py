@@ -3,13 +3,100 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Hashable
+from io import BytesIO
 from typing import Any
 
 import requests
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .schemas import EvidenceSource
 
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
+# Blank text and comments are never read; entities stay unexpanded for safety.
+_LXML_PARSE_OPTIONS = {
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "resolve_entities": False,
+    "huge_tree": False,
+}
+
+
+def _build_shared_session() -> requests.Session:
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "cdss-medqna", "Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+# Shared by default so esearch/efetch reuse keep-alive connections to NCBI.
+_SHARED_SESSION = _build_shared_session()
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Validates a whole parsed batch in one pydantic-core call.
+_EVIDENCE_ADAPTER = TypeAdapter(list[EvidenceSource])
+
+
+def _article_to_record(article) -> dict[str, Any]:
+    pmid = article.findtext(".//PMID")
+    title = (article.findtext(".//ArticleTitle") or "Untitled").strip()
+    abstract_texts = [node.text.strip() for node in article.findall(".//AbstractText") if node.text]
+    abstract = " ".join(abstract_texts) or "No abstract available."
+    year_text = article.findtext(".//PubDate/Year")
+    year = int(year_text) if year_text and year_text.isdigit() else None
+    url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else None
+    return {
+        "source_type": "pubmed",
+        "source_name": "PubMed",
+        "title": title,
+        "summary": abstract,
+        "year": year,
+        "url": url,
+        "source_accessible": True,
+    }
+
 
 class PubMedClient:
     """Minimal PubMed search/fetch client."""
@@ -19,9 +106,16 @@ class PubMedClient:
     def __init__(self, email: str | None = None, tool: str | None = None, session: requests.Session | None = None):
         self.email = email or os.getenv("NCBI_EMAIL")
         self.tool = tool or os.getenv("NCBI_TOOL", "cdss-medqna")
-        self.session = session or requests.Session()
+        self.session = session or _SHARED_SESSION
+        # Repeat questions are common; caching also spares the E-utilities rate limit.
+        self._cache = _TTLCache(maxsize=512, ttl=3600.0)
 
     def search(self, query: str, max_results: int = 5) -> list[str]:
+        key = ("search", query, max_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         params = {
             "db": "pubmed",
             "term": query,
@@ -35,7 +129,9 @@ class PubMedClient:
 
         resp = self.session.get(f"{self.base_url}/esearch.fcgi", params=params, timeout=15)
         resp.raise_for_status()
-        return self.parse_search_ids(resp.json())
+        ids = self.parse_search_ids(resp.json())
+        self._cache.set(key, tuple(ids))
+        return ids
 
     @staticmethod
     def parse_search_ids(payload: dict[str, Any]) -> list[str]:
@@ -45,6 +141,11 @@ class PubMedClient:
         if not pmids:
             return []
 
+        key = ("fetch", tuple(pmids))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         params = {
             "db": "pubmed",
             "id": ",".join(pmids),
@@ -56,32 +157,33 @@ class PubMedClient:
 
         resp = self.session.get(f"{self.base_url}/efetch.fcgi", params=params, timeout=15)
         resp.raise_for_status()
-        return self.parse_abstracts_xml(resp.text)
+        records = self.parse_abstracts_xml(resp.content)
+        self._cache.set(key, tuple(records))
+        return records
 
     @staticmethod
-    def parse_abstracts_xml(xml_text: str) -> list[EvidenceSource]:
-        root = ET.fromstring(xml_text)
-        records: list[EvidenceSource] = []
-        for article in root.findall(".//PubmedArticle"):
-            pmid = article.findtext(".//PMID")
-            title = (article.findtext(".//ArticleTitle") or "Untitled").strip()
-            abstract_texts = [node.text.strip() for node in article.findall(".//AbstractText") if node.text]
-            abstract = " ".join(abstract_texts) or "No abstract available."
-            year_text = article.findtext(".//PubDate/Year")
-            year = int(year_text) if year_text and year_text.isdigit() else None
-            url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else None
-            records.append(
-                EvidenceSource(
-                    source_type="pubmed",
-                    source_name="PubMed",
-                    title=title,
-                    summary=abstract,
-                    year=year,
-                    url=url,
-                    source_accessible=True,
-                )
+    def parse_abstracts_xml(xml_payload: str | bytes) -> list[EvidenceSource]:
+        """Parse an efetch payload; streams with lxml when it is installed."""
+
+        if LET is None:
+            root = ET.fromstring(xml_payload)
+            return _EVIDENCE_ADAPTER.validate_python(
+                [_article_to_record(article) for article in root.findall(".//PubmedArticle")]
             )
-        return records
+
+        if isinstance(xml_payload, str):
+            xml_payload = xml_payload.encode("utf-8")
+
+        records: list[dict[str, Any]] = []
+        for _, article in LET.iterparse(
+            BytesIO(xml_payload), events=("end",), tag="PubmedArticle", **_LXML_PARSE_OPTIONS
+        ):
+            records.append(_article_to_record(article))
+            # Drop parsed articles so memory stays flat for large batches.
+            article.clear(keep_tail=False)
+            while article.getprevious() is not None:
+                del article.getparent()[0]
+        return _EVIDENCE_ADAPTER.validate_python(records)
 
     def retrieve(self, query: str, max_results: int = 5) -> list[EvidenceSource]:
         ids = self.search(query=query, max_results=max_results)
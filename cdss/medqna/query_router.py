@@ -7,23 +7,22 @@ import re
 from .schemas import QueryType
 
 
-_DRUG_COMPARE_PATTERNS = (
-    r"\b(vs|versus|compare|comparison|better than|difference between)\b",
-)
+_MCQ_RE = re.compile(r"\b[a-d]\)")
+_DRUG_COMPARE_RE = re.compile(r"\b(?:vs|versus|compare|comparison|better than|difference between)\b")
+# Plain substrings on purpose ("drugs", "statins" must match), so no \b here.
+_DRUG_KEYWORD_RE = re.compile(r"drug|dose|statin|insulin")
 
 
 def route_query(question: str, mcq_mode: bool = False, choices: list[str] | None = None) -> QueryType:
     """Route query to general, MCQ, or drug-comparison workflows."""
 
     text = question.strip().lower()
-    normalized_choices = [c for c in (choices or []) if c.strip()]
+    has_choices = any(c.strip() for c in choices or ())
 
-    if mcq_mode or normalized_choices or re.search(r"\b(a\)|b\)|c\)|d\))", text):
+    if mcq_mode or has_choices or _MCQ_RE.search(text):
         return QueryType.MCQ
 
-    if any(re.search(pattern, text) for pattern in _DRUG_COMPARE_PATTERNS) and (
-        "drug" in text or "dose" in text or "statin" in text or "insulin" in text
-    ):
+    if _DRUG_COMPARE_RE.search(text) and _DRUG_KEYWORD_RE.search(text):
         return QueryType.DRUG_COMPARISON
 
     return QueryType.GENERAL
@@ -6,6 +6,17 @@ from .guideline_registry import get_guidelines
 from .pubmed_client import PubMedClient
 from .schemas import EvidenceSource
 
+_client: PubMedClient | None = None
+
+
+def _get_client() -> PubMedClient:
+    """Return a process-wide client so its connection pool persists across calls."""
+
+    global _client
+    if _client is None:
+        _client = PubMedClient()
+    return _client
+
 
 def retrieve_evidence(
     question: str,
@@ -17,7 +28,7 @@ def retrieve_evidence(
 
     evidence: list[EvidenceSource] = []
 
-    client = PubMedClient()
+    client = _get_client()
     try:
         evidence.extend(client.retrieve(question, max_results=pubmed_max_results))
     except Exception:
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
 
+EvidenceGrade = Literal["A", "B", "C"]
+
+
 class QueryType(str, Enum):
     GENERAL = "general"
     MCQ = "mcq"
@@ -20,6 +24,18 @@ class Citation(BaseModel):
     url: str | None = None
     note: str | None = None
 
+    @classmethod
+    def from_evidence(cls, item: EvidenceSource) -> Citation:
+        """Build a citation from an already-validated evidence item."""
+
+        return cls.model_construct(
+            source=item.source_name,
+            title=item.title,
+            year=item.year,
+            url=item.url,
+            note=None if item.source_accessible else "Estimated/Hypothesis-Based",
+        )
+
 
 class EvidenceSource(BaseModel):
     source_type: str
@@ -39,7 +55,7 @@ class MCQOptionExplanation(BaseModel):
 
 class VerificationReport(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
-    evidence_grade: str = Field(pattern="^[ABC]$")
+    evidence_grade: EvidenceGrade
     recent_evidence_ratio: float
     authority_ratio: float
     anatomy_physiology_consistent: bool
@@ -59,5 +75,5 @@ class StructuredAnswer(BaseModel):
     citations: list[Citation] = Field(default_factory=list)
     mcq_explanations: list[MCQOptionExplanation] = Field(default_factory=list)
     confidence: float = 0.0
-    evidence_grade: str = "C"
+    evidence_grade: EvidenceGrade = "C"
     notes: list[str] = Field(default_factory=list)
@@ -2,41 +2,80 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import functools
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
 
 from .schemas import EvidenceSource, VerificationReport
 
-_AUTHORITIES = {"WHO", "AHA/ACC", "ADA", "KDIGO", "NCCN", "EULAR", "PubMed"}
+# Confidence cut-offs, ascending; grade i applies from _GRADE_THRESHOLDS[i - 1].
+_GRADE_THRESHOLDS = (0.6, 0.8)
+_GRADE_LABELS = ("C", "B", "A")
 
+_AUTHORITIES: frozenset[str] = frozenset({"WHO", "AHA/ACC", "ADA", "KDIGO", "NCCN", "EULAR", "PubMed"})
 
-def verify_answer(
-    evidence: list[EvidenceSource],
-    anatomy_physiology_consistent: bool = True,
+_YEAR_TTL_SECONDS = 3600.0
+_year_cache: tuple[float, int] = (float("-inf"), 0)
+
+
+def _current_year() -> int:
+    """Return the current UTC year, refreshed at most once an hour."""
+
+    global _year_cache
+    now = time.monotonic()
+    checked_at, year = _year_cache
+    if now - checked_at > _YEAR_TTL_SECONDS:
+        year = datetime.now(timezone.utc).year
+        _year_cache = (now, year)
+    return year
+
+
+# (source_accessible, year, source_name) per evidence item: everything the
+# score depends on.
+_EvidenceKey = tuple[tuple[bool, int | None, str], ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def _verify_cached(
+    evidence_key: _EvidenceKey,
+    anatomy_physiology_consistent: bool,
+    current_year: int,
 ) -> VerificationReport:
-    """Check recency, authority, and consistency and generate confidence."""
+    if not evidence_key:
+        return VerificationReport(
+            confidence=0.0,
+            evidence_grade="C",
+            recent_evidence_ratio=0.0,
+            authority_ratio=0.0,
+            anatomy_physiology_consistent=anatomy_physiology_consistent,
+            notes=["No evidence retrieved."],
+        )
 
-    current_year = datetime.utcnow().year
     recent_cutoff = current_year - 3
-    accessible = [item for item in evidence if item.source_accessible]
 
-    recent_count = sum(1 for item in accessible if item.year is not None and item.year >= recent_cutoff)
-    recent_ratio = recent_count / len(accessible) if accessible else 0.0
+    accessible_count = recent_count = authority_count = 0
+    has_inaccessible = False
+    for accessible, year, source_name in evidence_key:
+        if not accessible:
+            has_inaccessible = True
+            continue
+        accessible_count += 1
+        if year is not None and year >= recent_cutoff:
+            recent_count += 1
+        if source_name in _AUTHORITIES:
+            authority_count += 1
 
-    authority_count = sum(1 for item in accessible if item.source_name in _AUTHORITIES)
-    authority_ratio = authority_count / len(accessible) if accessible else 0.0
+    recent_ratio = recent_count / accessible_count if accessible_count else 0.0
+    authority_ratio = authority_count / accessible_count if accessible_count else 0.0
 
     consistency_score = 1.0 if anatomy_physiology_consistent else 0.5
     confidence = round(0.5 * recent_ratio + 0.35 * authority_ratio + 0.15 * consistency_score, 2)
 
-    if confidence >= 0.8:
-        grade = "A"
-    elif confidence >= 0.6:
-        grade = "B"
-    else:
-        grade = "C"
+    grade = _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, confidence)]
 
     notes: list[str] = []
-    if any(not item.source_accessible for item in evidence):
+    if has_inaccessible:
         notes.append("Some sources were inaccessible; portions are Estimated/Hypothesis-Based.")
     if recent_ratio < 0.5:
         notes.append("Limited evidence from the last 3 years.")
@@ -51,3 +90,18 @@ def verify_answer(
         anatomy_physiology_consistent=anatomy_physiology_consistent,
         notes=notes,
     )
+
+
+def verify_answer(
+    evidence: list[EvidenceSource],
+    anatomy_physiology_consistent: bool = True,
+) -> VerificationReport:
+    """Check recency, authority, and consistency and generate confidence.
+
+    Reports are memoized on the scoring-relevant evidence fields; callers
+    get a copy with its own ``notes`` list.
+    """
+
+    evidence_key = tuple((item.source_accessible, item.year, item.source_name) for item in evidence)
+    report = _verify_cached(evidence_key, anatomy_physiology_consistent, _current_year())
+    return report.model_copy(update={"notes": list(report.notes)})
@@ -2,7 +2,7 @@
 
 Implements:
 - input validation
-- rule evaluation
+- rule evaluation (optionally pre-validated via CompiledRules)
 - explanation output
 """
 
@@ -10,6 +10,10 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Sequence
 
 
+_MISSING = object()
+_MEMO_MAXSIZE = 4096
+
+
 class ValidationError(ValueError):
     """Raised when engine input or rule definitions are invalid."""
 
@@ -23,12 +27,16 @@ class Rule:
         description: Human-readable purpose.
         condition: Callable that receives facts and returns True/False.
         outcome: Decision payload applied when condition is True.
+        reads: Optional fact names the condition depends on. When set, a
+            CompiledRules instance memoizes the result per distinct values
+            (and value types).
     """
 
     id: str
     description: str
     condition: Callable[[Dict[str, Any]], bool]
     outcome: Dict[str, Any]
+    reads: tuple[str, ...] = ()
 
 
 @dataclass
@@ -75,40 +83,101 @@ def validate_rules(rules: Sequence[Rule]) -> None:
         seen_ids.add(rule.id)
 
 
-def evaluate_rules(facts: Dict[str, Any], rules: Sequence[Rule]) -> EvaluationResult:
-    """Evaluate all rules and generate traceable explanation output."""
+@dataclass(frozen=True)
+class CompiledRules:
+    """A rule collection validated once and reusable across many fact sets.
 
-    validate_rules(rules)
+    Attributes:
+        rules: Validated rules, evaluated in order.
+    """
+
+    rules: tuple[Rule, ...]
+    _memo: Dict[str, Dict[tuple, bool]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        validate_rules(self.rules)
+        object.__setattr__(self, "rules", tuple(self.rules))
+        self._memo.update({rule.id: {} for rule in self.rules if rule.reads})
+
+    def _matches(self, rule: Rule, facts: Dict[str, Any]) -> bool:
+        memo = self._memo.get(rule.id)
+        if memo is None:
+            return bool(rule.condition(facts))
+
+        # Pair each value with its type so 1, 1.0 and True stay distinct keys.
+        key = tuple((type(value), value) for value in (facts.get(name, _MISSING) for name in rule.reads))
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable fact values cannot be memoized.
+            return bool(rule.condition(facts))
 
-    result = EvaluationResult()
-    for rule in rules:
         matched = bool(rule.condition(facts))
-        outcome = rule.outcome if matched else None
+        if len(memo) >= _MEMO_MAXSIZE:
+            memo.clear()
+        memo[key] = matched
+        return matched
+
+    def evaluate(self, facts: Dict[str, Any], explain: bool = True) -> EvaluationResult:
+        """Evaluate all rules without re-validating the collection.
+
+        With ``explain=False`` only matched outcomes are collected and the
+        explanation list is left empty.
+        """
+
+        result = EvaluationResult()
+        add_outcome = result.matched_outcomes.append
+        matches = self._matches
+        if not explain:
+            for rule in self.rules:
+                if matches(rule, facts):
+                    add_outcome(rule.outcome)
+            return result
+
+        add_explanation = result.explanation.append
+        for rule in self.rules:
+            matched = matches(rule, facts)
+            if matched:
+                add_outcome(rule.outcome)
+            add_explanation(
+                Explanation(
+                    rule_id=rule.id,
+                    description=rule.description,
+                    matched=matched,
+                    outcome=rule.outcome if matched else None,
+                )
+            )
+        return result
 
-        if matched:
-            result.matched_outcomes.append(rule.outcome)
 
-        result.explanation.append(
-            Explanation(
-                rule_id=rule.id,
-                description=rule.description,
-                matched=matched,
-                outcome=outcome,
-            )
-        )
+def evaluate_rules(
+    facts: Dict[str, Any],
+    rules: Sequence[Rule] | CompiledRules,
+    explain: bool = True,
+) -> EvaluationResult:
+    """Evaluate all rules and generate traceable explanation output."""
 
-    return result
+    if not isinstance(rules, CompiledRules):
+        rules = CompiledRules(rules)
+    return rules.evaluate(facts, explain=explain)
 
 
 def run_engine(
     facts: Dict[str, Any],
-    rules: Sequence[Rule],
+    rules: Sequence[Rule] | CompiledRules,
     required_fields: Sequence[str] = (),
+    explain: bool = True,
 ) -> EvaluationResult:
-    """Validate input and evaluate rules in one function call."""
+    """Validate input and evaluate rules in one function call.
+
+    Pass ``explain=False`` for batch scoring that only reads
+    ``matched_outcomes``.
+    """
 
     validate_facts(facts, required_fields)
-    return evaluate_rules(facts, rules)
+    return evaluate_rules(facts, rules, explain=explain)
 
 
 if __name__ == "__main__":
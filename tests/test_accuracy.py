@@ -0,0 +1,39 @@
+import math
+
+from validation_suite.metrics.accuracy import compute_implant_deviation, compute_safety_margin, xyz
+
+
+def test_compute_implant_deviation_rmse():
+    plan = [{"x": 1.0, "y": 0.0, "z": 0.0}, {"x": 0.0, "y": 0.0, "z": 0.0}]
+    ground_truth = [{"x": 0.0, "y": 0.0, "z": 0.0}, {"x": 0.0, "y": 3.0, "z": 4.0}]
+    assert math.isclose(compute_implant_deviation(plan, ground_truth), math.sqrt((1.0 + 25.0) / 2))
+
+
+def test_compute_implant_deviation_large_batch_matches_loop():
+    plan = [{"x": float(i), "y": 2.0 * i, "z": 1.0} for i in range(100)]
+    ground_truth = [{"x": i + 0.5, "y": 2.0 * i, "z": 0.0} for i in range(100)]
+    assert math.isclose(compute_implant_deviation(plan, ground_truth), math.sqrt(1.25))
+
+
+def test_compute_implant_deviation_defaults_missing_coordinates():
+    assert compute_implant_deviation([{"x": 3.0}], [{"y": 4.0}]) == 5.0
+    assert compute_implant_deviation([], [{"x": 1.0}]) == 0.0
+
+
+def test_compute_safety_margin():
+    assert compute_safety_margin(2.5) == {"min_distance": 2.5, "safety_margin": 0.5, "is_safe": True}
+    assert compute_safety_margin(1.0)["is_safe"] is False
+
+
+def test_xyz_defaults_missing_axes():
+    assert xyz({"x": 1.0, "y": 2.0, "z": 3.0}) == (1.0, 2.0, 3.0)
+    assert xyz({"y": "2"}) == (0.0, 2.0, 0.0)
+
+
+def test_compute_implant_deviation_coerces_str_and_int_on_both_paths():
+    for count in (1, 40):
+        plan = [{"x": "1", "y": "0", "z": 0}] * count
+        ground_truth = [{"x": 0, "y": 0, "z": "0"}] * count
+        assert compute_implant_deviation(plan, ground_truth) == 1.0
+    assert xyz({"x": 1, "y": "2", "z": 3}) == (1.0, 2.0, 3.0)
+    assert all(type(v) is float for v in xyz({"x": 1, "y": 2, "z": 3}))
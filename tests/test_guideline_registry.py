@@ -0,0 +1,18 @@
+from cdss.medqna.guideline_registry import get_guidelines
+
+
+def test_get_guidelines_specialty_includes_general_first():
+    names = [item.source_name for item in get_guidelines("Cardiology")]
+    assert names == ["WHO", "AHA/ACC"]
+
+
+def test_get_guidelines_unknown_specialty_falls_back_to_general():
+    assert [item.source_name for item in get_guidelines("dermatology")] == ["WHO"]
+
+
+def test_get_guidelines_all_and_user_links():
+    evidence = get_guidelines("all", user_links=["https://example.org/guide"])
+    assert [item.source_name for item in evidence[:-1]] == ["WHO", "AHA/ACC", "ADA", "KDIGO", "NCCN", "EULAR"]
+    assert evidence[-1].source_name == "User-provided"
+    assert evidence[-1].url == "https://example.org/guide"
+    assert len(get_guidelines("all")) == 6
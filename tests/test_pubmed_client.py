@@ -34,3 +34,40 @@ def test_parse_abstracts_xml_extracts_core_fields():
     assert "Line one." in items[0].summary
     assert items[0].year == 2024
     assert items[0].url == "https://pubmed.ncbi.nlm.nih.gov/12345/"
+
+
+class _FakeResponse:
+    def __init__(self, payload=None, content=b""):
+        self._payload = payload
+        self.content = content
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+class _CountingSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(url)
+        if url.endswith("esearch.fcgi"):
+            return _FakeResponse(payload={"esearchresult": {"idlist": ["1"]}})
+        return _FakeResponse(
+            content=b"<PubmedArticleSet><PubmedArticle><PMID>1</PMID>"
+            b"<ArticleTitle>Cached</ArticleTitle></PubmedArticle></PubmedArticleSet>"
+        )
+
+
+def test_retrieve_serves_repeat_queries_from_cache():
+    session = _CountingSession()
+    client = PubMedClient(session=session)
+
+    first = client.retrieve("copd exacerbation", max_results=1)
+    second = client.retrieve("copd exacerbation", max_results=1)
+
+    assert [item.title for item in second] == [item.title for item in first] == ["Cached"]
+    assert len(session.calls) == 2
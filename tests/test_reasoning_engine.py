@@ -5,7 +5,7 @@ import pytest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
-from reasoning_engine import Rule, ValidationError, run_engine
+from reasoning_engine import CompiledRules, Rule, ValidationError, run_engine
 
 
 def test_run_engine_matches_expected_rules():
@@ -45,3 +45,65 @@ def test_run_engine_missing_required_facts_raises_validation_error():
 
     with pytest.raises(ValidationError, match=r"missing required fact\(s\): age"):
         run_engine({"bp": 120}, rules, required_fields=["age"])
+
+
+def test_compiled_rules_validate_once_and_evaluate_repeatedly():
+    compiled = CompiledRules(
+        [
+            Rule(
+                id="bp_high",
+                description="Detect elevated blood pressure",
+                condition=lambda f: f["bp"] >= 140,
+                outcome={"alert": "high_bp"},
+            )
+        ]
+    )
+
+    assert isinstance(compiled.rules, tuple)
+    assert run_engine({"bp": 150}, compiled).matched_outcomes == [{"alert": "high_bp"}]
+    assert compiled.evaluate({"bp": 120}).matched_outcomes == []
+
+
+def test_compiled_rules_reject_duplicate_ids():
+    rule = Rule(id="dup", description="Duplicate", condition=lambda _: True, outcome={})
+
+    with pytest.raises(ValidationError, match="duplicate rule id: dup"):
+        CompiledRules([rule, rule])
+
+
+def test_compiled_rules_memoize_conditions_on_declared_reads():
+    calls = []
+
+    def bp_high(facts):
+        calls.append(facts["bp"])
+        return facts["bp"] >= 140
+
+    compiled = CompiledRules(
+        [Rule(id="bp_high", description="Elevated BP", condition=bp_high, outcome={"alert": "high_bp"}, reads=("bp",))]
+    )
+
+    assert compiled.evaluate({"bp": 150, "age": 40}).matched_outcomes == [{"alert": "high_bp"}]
+    assert compiled.evaluate({"bp": 150, "age": 70}).matched_outcomes == [{"alert": "high_bp"}]
+    assert compiled.evaluate({"bp": 120, "age": 70}).matched_outcomes == []
+    assert calls == [150, 120]
+
+
+def test_run_engine_without_explanations_keeps_outcomes():
+    rules = [
+        Rule(id="bp_high", description="Elevated BP", condition=lambda f: f["bp"] >= 140, outcome={"alert": "high_bp"}),
+        Rule(id="age_old", description="Older adult", condition=lambda f: f["age"] >= 65, outcome={"alert": "older"}),
+    ]
+
+    result = run_engine({"bp": 150, "age": 40}, rules, explain=False)
+
+    assert result.matched_outcomes == [{"alert": "high_bp"}]
+    assert result.explanation == []
+
+
+def test_compiled_rules_memo_keeps_equal_values_of_different_types_apart():
+    compiled = CompiledRules(
+        [Rule(id="flag", description="Flag set", condition=lambda f: f["flag"] is True, outcome={}, reads=("flag",))]
+    )
+
+    assert compiled.evaluate({"flag": 1}).matched_outcomes == []
+    assert compiled.evaluate({"flag": True}).matched_outcomes == [{}]
@@ -0,0 +1,60 @@
+import csv
+import shutil
+import sys
+from pathlib import Path
+
+from validation_suite import runner
+from validation_suite.dataset_loader import load_case
+
+DATASETS = Path(__file__).resolve().parents[1] / "validation_suite" / "datasets"
+
+
+def test_cli_help_lists_validate_option():
+    assert "--validate" in runner._build_parser().format_help()
+
+
+def test_cli_validate_runs_in_process(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["dental-guide", "--validate", str(DATASETS)])
+
+    assert runner.main() == 0
+
+    with (tmp_path / "validation_summary.csv").open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["case_id"] for row in rows] == ["case_001"]
+    assert rows[0]["passed"] == "True"
+    assert "case_001" in (tmp_path / "validation_suite" / "reports" / "validation_report.html").read_text(
+        encoding="utf-8"
+    )
+
+
+def _read_summary(path):
+    with path.open(encoding="utf-8", newline="") as handle:
+        return [{k: v for k, v in row.items() if k != "execution_time_ms"} for row in csv.DictReader(handle)]
+
+
+def test_run_validation_pool_matches_serial(tmp_path, monkeypatch):
+    dataset = tmp_path / "dataset"
+    for case_id in ("case_a", "case_b", "case_c"):
+        shutil.copytree(DATASETS / "case_001", dataset / case_id)
+    monkeypatch.chdir(tmp_path)
+
+    serial_code = runner.run_validation(str(dataset), workers=1)
+    serial = _read_summary(tmp_path / "validation_summary.csv")
+    pooled_code = runner.run_validation(str(dataset), workers=2)
+    pooled = _read_summary(tmp_path / "validation_summary.csv")
+
+    assert [row["case_id"] for row in serial] == ["case_a", "case_b", "case_c"]
+    assert pooled == serial
+    assert pooled_code == serial_code
+
+
+def test_load_case_treats_existing_cbct_directory_as_loaded(tmp_path):
+    case_dir = tmp_path / "case_009"
+    shutil.copytree(DATASETS / "case_001", case_dir)
+    (case_dir / "cbct").mkdir()
+
+    case_data = load_case(str(case_dir))
+    assert case_data["cbct_dir"] == str(case_dir / "cbct")
+    assert case_data["cbct_loaded"] is True
+    assert runner.run_full_pipeline(case_data)["guide_generated"] is True
@@ -43,3 +43,21 @@ def test_verifier_inaccessible_sources_lower_confidence():
     report = verify_answer(evidence)
     assert report.confidence <= 0.2
     assert any("Estimated/Hypothesis-Based" in note for note in report.notes)
+
+
+def test_verifier_empty_evidence_short_circuits():
+    report = verify_answer([])
+    assert report.confidence == 0.0
+    assert report.evidence_grade == "C"
+    assert report.notes == ["No evidence retrieved."]
+
+
+def test_verifier_cached_reports_do_not_share_notes():
+    evidence = [EvidenceSource(source_type="pubmed", source_name="PubMed", title="Old", summary="", year=2000)]
+
+    first = verify_answer(evidence)
+    first.notes.append("edited by caller")
+    second = verify_answer(evidence)
+
+    assert second == first.model_copy(update={"notes": second.notes})
+    assert "edited by caller" not in second.notes
@@ -2,54 +2,97 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _first_existing(case_dir: Path, patterns: list[str]) -> str | None:
+
+def _scan_dir(case_dir: Path) -> tuple[list[str], set[str]]:
+    files: list[str] = []
+    dirs: set[str] = set()
+    with os.scandir(case_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                files.append(entry.name)
+            elif entry.is_dir():
+                dirs.add(entry.name)
+    files.sort()
+    return files, dirs
+
+
+def _first_existing(case_dir: Path, patterns: list[str], names: list[str]) -> str | None:
     for pattern in patterns:
-        matches = sorted(case_dir.glob(pattern))
+        matches = fnmatch.filter(names, pattern)
         if matches:
-            return str(matches[0])
+            return str(case_dir / matches[0])
     return None
 
 
+def _normalize_implant(implant: object) -> object:
+    if not isinstance(implant, dict):
+        return implant
+    return {
+        **implant,
+        "x": float(implant.get("x", 0.0)),
+        "y": float(implant.get("y", 0.0)),
+        "z": float(implant.get("z", 0.0)),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _load_ground_truth_cached(path_str: str, mtime_ns: int) -> tuple[dict, ...]:
+    # mtime_ns is unused in the body; it is part of the cache key so edits reload.
+    data = Path(path_str).read_bytes()
+    payload = orjson.loads(data) if orjson is not None else json.loads(data)
+    if isinstance(payload, dict):
+        payload = payload.get("implants")
+    if isinstance(payload, list):
+        # Every implant carries float x/y/z so metric loops can use itemgetter.
+        return tuple(_normalize_implant(implant) for implant in payload)
+    return ()
+
+
 def _load_ground_truth(path: Path) -> list[dict]:
-    if not path.exists():
+    if path.suffix.lower() != ".json":
         return []
 
-    if path.suffix.lower() == ".json":
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(payload, list):
-            return payload
-        if isinstance(payload, dict):
-            implants = payload.get("implants")
-            if isinstance(implants, list):
-                return implants
-    return []
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return list(_load_ground_truth_cached(str(path), mtime_ns))
 
 
 def load_case(case_dir: str) -> dict:
     """Load one validation case directory into a standard dictionary."""
 
     case_path = Path(case_dir)
-    if not case_path.exists() or not case_path.is_dir():
+    if not case_path.is_dir():
         raise FileNotFoundError(f"Case directory not found: {case_dir}")
 
-    cbct_dir = case_path / "cbct"
-    if not cbct_dir.exists():
-        cbct_dir = case_path
+    # One scandir pass serves the cbct, ios, canal and ground-truth lookups.
+    names, subdirs = _scan_dir(case_path)
+
+    cbct_dir = case_path / "cbct" if "cbct" in subdirs else case_path
 
-    ios_path = _first_existing(case_path, ["*ios*.stl", "*IOS*.stl", "*.stl", "*.ply"])
-    canal_path = _first_existing(case_path, ["*canal*.json", "*canal*.nii*", "*canal*.csv"])
+    ios_path = _first_existing(case_path, ["*ios*.stl", "*IOS*.stl", "*.stl", "*.ply"], names)
+    canal_path = _first_existing(case_path, ["*canal*.json", "*canal*.nii*", "*canal*.csv"], names)
 
-    gt_json = case_path / "ground_truth_implants.json"
-    if not gt_json.exists():
-        gt_json = case_path / "ground_truth.json"
+    gt_name = "ground_truth_implants.json" if "ground_truth_implants.json" in names else "ground_truth.json"
+    gt_json = case_path / gt_name
 
     return {
         "case_id": case_path.name,
         "cbct_dir": str(cbct_dir),
+        # Same as cbct_dir.exists(): the scan just saw cbct/ or the case directory.
+        "cbct_loaded": True,
         "ios_path": ios_path,
         "canal_path": canal_path,
         "ground_truth_implants": _load_ground_truth(gt_json),
@@ -3,8 +3,62 @@
 from __future__ import annotations
 
 import math
+from operator import itemgetter
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this many implants the plain loop is faster than building arrays.
+_NUMPY_MIN_COUNT = 32
+
+_XYZ = itemgetter("x", "y", "z")
+
+
+def xyz(point: dict) -> tuple[float, float, float]:
+    """Return a point's coordinates, defaulting missing axes to 0.0.
+
+    Loaded ground truth is normalized to carry all three keys, so the
+    single itemgetter call is the common path.
+    """
+
+    try:
+        x, y, z = _XYZ(point)
+    except KeyError:
+        return float(point.get("x", 0.0)), float(point.get("y", 0.0)), float(point.get("z", 0.0))
+    return float(x), float(y), float(z)
+
+
+def _coords_array(points: list[dict], count: int):
+    return np.fromiter(
+        (v for d in points[:count] for v in xyz(d)),
+        dtype=np.float64,
+        count=count * 3,
+    ).reshape(count, 3)
+
+
+def _rmse_loop(plan, ground_truth) -> float:
+    n = plan.shape[0]
+    acc = 0.0
+    for i in range(n):
+        dx = plan[i, 0] - ground_truth[i, 0]
+        dy = plan[i, 1] - ground_truth[i, 1]
+        dz = plan[i, 2] - ground_truth[i, 2]
+        acc += dx * dx + dy * dy + dz * dz
+    return math.sqrt(acc / n)
+
+
+# Compiled once per machine (cache=True) when numba is installed; the einsum
+# path below is used otherwise.
+_rmse_kernel = njit(cache=True, fastmath=True)(_rmse_loop) if njit is not None else None
+
 
 def compute_implant_deviation(plan: Any, ground_truth: Any) -> float:
     """Compute RMSE deviation between planned and ground-truth implant centroids."""
@@ -19,13 +73,18 @@ def compute_implant_deviation(plan: Any, ground_truth: Any) -> float:
     if count == 0:
         return 0.0
 
+    if np is not None and count >= _NUMPY_MIN_COUNT:
+        plan_xyz = _coords_array(plan, count)
+        truth_xyz = _coords_array(ground_truth, count)
+        if _rmse_kernel is not None:
+            return float(_rmse_kernel(plan_xyz, truth_xyz))
+        diff = plan_xyz - truth_xyz
+        return float(np.sqrt(np.einsum("ij,ij->", diff, diff) / count))
+
     error_sum = 0.0
     for idx in range(count):
-        p = plan[idx]
-        g = ground_truth[idx]
-
-        px, py, pz = float(p.get("x", 0.0)), float(p.get("y", 0.0)), float(p.get("z", 0.0))
-        gx, gy, gz = float(g.get("x", 0.0)), float(g.get("y", 0.0)), float(g.get("z", 0.0))
+        px, py, pz = xyz(plan[idx])
+        gx, gy, gz = xyz(ground_truth[idx])
 
         squared_distance = (px - gx) ** 2 + (py - gy) ** 2 + (pz - gz) ** 2
         error_sum += squared_distance
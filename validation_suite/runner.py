@@ -4,20 +4,25 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
 import html
 import json
+import multiprocessing
+import re
 import time
+from operator import itemgetter
 from pathlib import Path
 
 from validation_suite.config import THRESHOLDS
 from validation_suite.dataset_loader import load_case
-from validation_suite.metrics.accuracy import compute_implant_deviation, compute_safety_margin
+from validation_suite.metrics.accuracy import compute_implant_deviation, compute_safety_margin, xyz
 
 
+@functools.lru_cache(maxsize=None)
 def _stable_seed(case_id: str) -> int:
-    digest = hashlib.md5(case_id.encode("utf-8")).hexdigest()
-    return int(digest[:8], 16)
+    digest = hashlib.md5(case_id.encode("utf-8"), usedforsecurity=False).digest()
+    return int.from_bytes(digest[:4], "big")
 
 
 def _pseudo_planned_implants(ground_truth: list[dict], case_id: str) -> list[dict]:
@@ -30,11 +35,12 @@ def _pseudo_planned_implants(ground_truth: list[dict], case_id: str) -> list[dic
 
     plan: list[dict] = []
     for implant in ground_truth:
+        x, y, z = xyz(implant)
         plan.append(
             {
-                "x": float(implant.get("x", 0.0)) + (0.2 * sign) + jitter / 10.0,
-                "y": float(implant.get("y", 0.0)) + (0.1 * sign),
-                "z": float(implant.get("z", 0.0)) + (0.15 * sign),
+                "x": x + (0.2 * sign) + jitter / 10.0,
+                "y": y + (0.1 * sign),
+                "z": z + (0.15 * sign),
             }
         )
     return plan
@@ -46,8 +52,9 @@ def run_full_pipeline(case_data: dict) -> dict:
     start = time.perf_counter()
 
     # 1) Load CBCT
-    cbct_dir = Path(case_data["cbct_dir"])
-    cbct_loaded = cbct_dir.exists()
+    cbct_loaded = case_data.get("cbct_loaded")
+    if cbct_loaded is None:
+        cbct_loaded = Path(case_data["cbct_dir"]).exists()
 
     # 2) Generate surface
     surface_generated = cbct_loaded
@@ -90,36 +97,27 @@ def _collect_case_dirs(dataset_root: Path) -> list[Path]:
     return case_dirs
 
 
+_CSV_FIELDS = (
+    "case_id",
+    "rmse",
+    "min_canal_distance",
+    "guide_generated",
+    "execution_time_ms",
+    "passed",
+)
+_csv_row = itemgetter(*_CSV_FIELDS)
+
+
 def _write_csv(output_path: Path, rows: list[dict]) -> None:
-    fieldnames = [
-        "case_id",
-        "rmse",
-        "min_canal_distance",
-        "guide_generated",
-        "execution_time_ms",
-        "passed",
-    ]
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(_CSV_FIELDS)
+        writer.writerows(map(_csv_row, rows))
 
 
-def _write_html_report(output_path: Path, rows: list[dict], pass_rate: float) -> None:
-    table_rows = "\n".join(
-        (
-            f"<tr><td>{html.escape(str(row['case_id']))}</td>"
-            f"<td>{row['rmse']:.3f}</td>"
-            f"<td>{row['min_canal_distance']:.3f}</td>"
-            f"<td>{row['guide_generated']}</td>"
-            f"<td>{row['execution_time_ms']}</td>"
-            f"<td>{'PASS' if row['passed'] else 'FAIL'}</td></tr>"
-        )
-        for row in rows
-    )
+_HTML_SPECIAL = re.compile(r"[&<>\"']")
 
-    output_path.write_text(
-        """<!doctype html>
+_HTML_HEAD = """<!doctype html>
 <html>
 <head><meta charset=\"utf-8\"><title>Dental Guide Validation Report</title></head>
 <body>
@@ -129,42 +127,84 @@ def _write_html_report(output_path: Path, rows: list[dict], pass_rate: float) ->
 <table border=\"1\" cellpadding=\"6\" cellspacing=\"0\">
 <thead><tr><th>Case</th><th>RMSE (mm)</th><th>Min Canal Distance (mm)</th><th>Guide Generated</th><th>Execution Time (ms)</th><th>Status</th></tr></thead>
 <tbody>
-{rows}
+"""
+
+_HTML_TAIL = """
 </tbody>
 </table>
 </body>
 </html>
-""".format(
-            max_rmse=THRESHOLDS.max_rmse,
-            min_dist=THRESHOLDS.min_canal_distance,
-            min_success=THRESHOLDS.min_guide_success_rate,
-            pass_rate=pass_rate,
-            rows=table_rows,
-        ),
-        encoding="utf-8",
-    )
+"""
 
 
-def run_validation(dataset_path: str) -> int:
-    dataset_root = Path(dataset_path)
-    case_dirs = _collect_case_dirs(dataset_root)
-
-    results: list[dict] = []
-    for case_dir in case_dirs:
-        case_data = load_case(str(case_dir))
-        metrics = run_full_pipeline(case_data)
-        passed = (
-            metrics["rmse"] <= THRESHOLDS.max_rmse
-            and metrics["min_canal_distance"] >= THRESHOLDS.min_canal_distance
-            and metrics["guide_generated"]
+def _escape(value: object) -> str:
+    text = str(value)
+    # Case ids are almost always plain alphanumerics; skip escaping them.
+    return html.escape(text) if _HTML_SPECIAL.search(text) else text
+
+
+def _write_html_report(output_path: Path, rows: list[dict], pass_rate: float) -> None:
+    with output_path.open("w", encoding="utf-8") as handle:
+        write = handle.write
+        write(
+            _HTML_HEAD.format(
+                max_rmse=THRESHOLDS.max_rmse,
+                min_dist=THRESHOLDS.min_canal_distance,
+                min_success=THRESHOLDS.min_guide_success_rate,
+                pass_rate=pass_rate,
+            )
         )
-        results.append({"case_id": case_data["case_id"], **metrics, "passed": passed})
+        separator = ""
+        for row in rows:
+            write(
+                f"{separator}<tr><td>{_escape(row['case_id'])}</td>"
+                f"<td>{row['rmse']:.3f}</td>"
+                f"<td>{row['min_canal_distance']:.3f}</td>"
+                f"<td>{row['guide_generated']}</td>"
+                f"<td>{row['execution_time_ms']}</td>"
+                f"<td>{'PASS' if row['passed'] else 'FAIL'}</td></tr>"
+            )
+            separator = "\n"
+        write(_HTML_TAIL)
+
+
+def _run_one_case(case_dir: str) -> dict:
+    """Load and validate one case; top-level so worker processes can pickle it."""
+
+    case_data = load_case(case_dir)
+    metrics = run_full_pipeline(case_data)
+    passed = (
+        metrics["rmse"] <= THRESHOLDS.max_rmse
+        and metrics["min_canal_distance"] >= THRESHOLDS.min_canal_distance
+        and metrics["guide_generated"]
+    )
+    return {"case_id": case_data["case_id"], **metrics, "passed": passed}
 
+
+def run_validation(dataset_path: str, workers: int = 1) -> int:
+    dataset_root = Path(dataset_path)
+    case_dirs = [str(case_dir) for case_dir in _collect_case_dirs(dataset_root)]
+
+    # Cases take microseconds each, so a pool only pays off for large datasets
+    # and is opt-in. Serial runs also keep the ground-truth cache warm.
+    processes = min(max(workers, 1), len(case_dirs))
+    if processes > 1:
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.map(_run_one_case, case_dirs)
+    else:
+        results = [_run_one_case(case_dir) for case_dir in case_dirs]
+
+    # One pass for all aggregates; a numpy array costs more than it saves here.
     case_count = len(results)
-    guide_success_rate = (
-        sum(1 for row in results if row["guide_generated"]) / case_count if case_count else 0.0
-    )
-    pass_rate = sum(1 for row in results if row["passed"]) / case_count if case_count else 0.0
+    guide_count = 0
+    passed_count = 0
+    for row in results:
+        if row["guide_generated"]:
+            guide_count += 1
+        if row["passed"]:
+            passed_count += 1
+    guide_success_rate = guide_count / case_count if case_count else 0.0
+    pass_rate = passed_count / case_count if case_count else 0.0
 
     csv_path = Path("validation_summary.csv")
     report_dir = Path("validation_suite/reports")
@@ -181,7 +221,7 @@ def run_validation(dataset_path: str) -> int:
     if not thresholds_ok:
         return 1
 
-    if any(not row["passed"] for row in results):
+    if passed_count != case_count:
         return 1
     return 0
 
@@ -189,6 +229,12 @@ def run_validation(dataset_path: str) -> int:
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="dental-guide")
     parser.add_argument("--validate", dest="validate", help="Path to validation dataset directory")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for validation (default: 1, serial)",
+    )
     return parser
 
 
@@ -197,7 +243,7 @@ def main() -> int:
     args = parser.parse_args()
 
     if args.validate:
-        return run_validation(args.validate)
+        return run_validation(args.validate, workers=args.workers)
 
     parser.print_help()
     return 0